@@ -1,6 +1,5 @@
 import sys
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QTimer, QObject, Signal
 from gui.main_frame import MainFrame
 from storage import load_prompts, save_prompts
 from utils import insert_prompt
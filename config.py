@@ -1,4 +1,3 @@
-import os
 import logging
 
 from yaml import safe_load, safe_dump
@@ -18,7 +17,8 @@ class ConfigManager:
         """Load configuration from file"""
         logger.info(f"Loading config from {self.config_file}")
         try:
-            self.config = safe_load(open(self.config_file, "r"))
+            with open(self.config_file, "r", encoding="utf-8") as configfile:
+                self.config = safe_load(configfile)
             logger.info("Loaded config from file")
         except Exception as e:
             logger.error(f"Error loading config: {e}")
@@ -36,7 +36,7 @@ class ConfigManager:
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, "w") as configfile:
+            with open(self.config_file, "w", encoding="utf-8") as configfile:
                 safe_dump(self.config, configfile)
         except Exception as e:
             logger.error(f"Error saving config: {e}")
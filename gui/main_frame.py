@@ -1,8 +1,6 @@
-import sys
 import os
 import gc
 import re
-import shiboken6
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -11,20 +9,22 @@ from PySide6.QtWidgets import (
     QPushButton,
     QLineEdit,
     QScrollArea,
-    QFrame,
     QApplication,
     QLabel,
     QSizePolicy,
     QDialog,
     QAbstractButton,
+    QMessageBox,
 )
-from PySide6.QtCore import Qt, QPoint, Signal, QTimer
-from PySide6.QtGui import QKeySequence, QShortcut, QKeyEvent
+from PySide6.QtCore import Qt, QPoint, QTimer
+from PySide6.QtGui import QCursor
 from gui.tag_panel import TagPanel
 from gui.edit_dialog import EditPromptDialog
 from gui.settings_dialog import SettingsDialog
 from gui.prompt_card import PromptCard
+from gui.utils.batch_processor import BatchProcessor
 from config import ConfigManager
+from storage import validate_prompt
 from gui.styles import style_manager
 import logging
 import time
@@ -56,6 +56,9 @@ class MainFrame(QMainWindow):
 
     hole_for_X_height = 34
     hole_for_taskbar_height = 40
+    drag_move_threshold = 8  # (pixels, manhattan length)
+    drag_move_interval = 16  # (milliseconds, ~60 moves per second)
+    render_chunk_size = 20  # (cards per event loop pass)
 
     def __init__(self, app):
         """
@@ -80,12 +83,22 @@ class MainFrame(QMainWindow):
         self.app = app
         self.prompts = []
         self.filtered_prompts = set()
+        self._tag_index = None
         self.is_overlay = False
         self.tag_panel = None
         self.tag_panel_shown = False
         self.dragging = False
         self.drag_offset = QPoint(0, 0)
+        self._hover_state = False
+        # Overlay drag moves are coalesced into one move per timer tick
+        self._drag_move_pending = False
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.timeout.connect(self._apply_drag_move)
         self.displayed_cards = []
+        self._card_pool = []
+        self._render_generation = 0
+        self._batch = BatchProcessor()
         self.collapsed = False
         self.resize(500, 600)
         self.setMinimumSize(200, 200)
@@ -96,8 +109,7 @@ class MainFrame(QMainWindow):
 
         self.previous_pos = None
 
-        # Set up mouse tracking for dragging
-        self.setMouseTracking(True)
+        # Mouse tracking is enabled only in overlay mode (apply_overlay_mode)
 
         self.setup_ui()
 
@@ -257,7 +269,11 @@ class MainFrame(QMainWindow):
         self.prompts_sizer = QVBoxLayout()
         # self.prompts_sizer.setContentsMargins(5, 5, 5, 5)
         self.prompts_sizer.setSpacing(5)
+        self.prompts_sizer.addStretch()
         self.prompts_container.setLayout(self.prompts_sizer)
+        # Cards of the previous container were cleaned up with it
+        self._card_pool = []
+        self.displayed_cards = []
 
         self.prompts_scroll.setWidget(self.prompts_container)
 
@@ -302,11 +318,10 @@ class MainFrame(QMainWindow):
         """
         try:
             self.prompts = prompts
+            self.invalidate_tag_index()
             self.filtered_prompts = set(range(len(prompts)))
             self.refresh_display()
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Error", f"Error loading prompts: {e}")
 
     def refresh_display(self):
@@ -332,66 +347,119 @@ class MainFrame(QMainWindow):
         """
         Update the list of prompts displayed in the main application window.
 
-        This method is responsible for clearing and rebuilding the list of prompt
-        cards displayed in the main application window. It ensures that the
-        current state of the filtered prompts is reflected in the user interface.
+        Prompt cards are kept in a pool and re-bound to the currently filtered
+        prompts instead of being destroyed and recreated. The pool grows on
+        demand and never shrinks; cards that are not needed are hidden.
+
+        The first render_chunk_size cards are shown right away, the rest are
+        bound in chunks on later event loop passes so input stays responsive
+        with large prompt libraries.
 
         Exceptions are caught and logged if there is an error during the update
         process.
         """
         try:
-            # Clear existing cards
-            for card in self.displayed_cards:
-                try:
-                    card.cleanup()
-                except AttributeError as e:
-                    logger.warning(
-                        "Ignoring error occured during cleanup of prompt card: [%s]: %s",
-                        type(e),
-                        e,
-                    )
-                except RuntimeError as e:
-                    if not re.search(OBJ_WAS_DELETED_REGEX, str(e)):
-                        print(str(e))
-                        raise
-
-            # Add prompt cards
-            current_index = 0
-            self.displayed_cards = []
-            for original_index, prompt in enumerate(self.prompts):
-                try:
-                    if original_index in self.filtered_prompts:
-                        card = PromptCard(
-                            self.prompts_container,  # Parent widget
-                            prompt,
-                            self.on_prompt_click,
-                            self.edit_prompt,
-                            self.delete_prompt,
-                            original_index,
-                            current_index,
-                        )
-                        # card_wrapper = QWidget()
-                        # card_wrapper_layout = QVBoxLayout()
-                        # card_wrapper_layout.addWidget(card)
-                        # card_wrapper.setLayout(card_wrapper_layout)
-                        self.prompts_sizer.addWidget(card)
-                        card.card_moved.connect(self.on_prompt_move)
-                        self.displayed_cards.append(card)
-                        current_index += 1
-                except Exception as e:
-                    logger.error(f"Error creating prompt card: {e}")
-                    continue
-
-            self.prompts_sizer.addStretch()
-            self.prompts_container.setLayout(self.prompts_sizer)
+            # Supersede chunks still pending from a previous update
+            self._render_generation += 1
+            visible = [
+                (original_index, prompt)
+                for original_index, prompt in enumerate(self.prompts)
+                if original_index in self.filtered_prompts
+            ]
+
+            # Hide unused cards of the pool
+            for card in self._card_pool[len(visible) :]:
+                card.hide()
+            # Cards bound by later chunks still show their previous prompt,
+            # keep them from being clicked, edited or dropped on until then
+            for card in self._card_pool[self.render_chunk_size : len(visible)]:
+                card.setEnabled(False)
+            self._render_chunk(self._render_generation, visible, 0)
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
+            logger.error(f"Error updating prompts list: [{type(e)}]: {e}")
+            QMessageBox.critical(self, "Error", f"Error updating prompts list: {e}")
+
+    def _render_chunk(self, generation, visible, start, slot=0):
+        """
+        Bind or create the cards for one chunk of the visible prompts.
 
+        A prompt that fails to display is logged and skipped, its card is
+        reused for the next prompt.
+
+        Args:
+            generation: Value of _render_generation when the update started.
+            visible: List of (original_index, prompt) tuples to display.
+            start: Index in visible of the first prompt of this chunk.
+            slot: Index in the card pool of the next card to bind, behind
+                start when prompts were skipped.
+        """
+        if generation != self._render_generation:
+            return
+        try:
+            end = min(start + self.render_chunk_size, len(visible))
+            # Repaint the container once for the whole chunk
+            self.prompts_container.setUpdatesEnabled(False)
+            try:
+                for current_index in range(start, end):
+                    original_index, prompt = visible[current_index]
+                    card = None
+                    try:
+                        if slot < len(self._card_pool):
+                            card = self._card_pool[slot]
+                            card.bind(prompt, original_index, slot)
+                        else:
+                            card = PromptCard(
+                                self.prompts_container,  # Parent widget
+                                prompt,
+                                self.on_prompt_click,
+                                self.edit_prompt,
+                                self.delete_prompt,
+                                original_index,
+                                slot,
+                            )
+                            card.card_moved.connect(self.on_prompt_move)
+                            card.tag_clicked.connect(self.on_tag_filter)
+                            # Keep the trailing stretch as the last layout item
+                            self.prompts_sizer.insertWidget(
+                                self.prompts_sizer.count() - 1, card
+                            )
+                            self._card_pool.append(card)
+                        card.setEnabled(True)
+                        card.show()
+                        slot += 1
+                    except Exception as e:
+                        logger.error(f"Error displaying prompt {original_index}: {e}")
+                        if slot < len(self._card_pool):
+                            # Pool card, rebound to the next prompt
+                            self._card_pool[slot].hide()
+                        elif card is not None:
+                            # Created but not added to the pool
+                            card.deleteLater()
+            finally:
+                self.prompts_container.setUpdatesEnabled(True)
+
+            self.displayed_cards = self._card_pool[:slot]
+            if end < len(visible):
+                QTimer.singleShot(
+                    0, lambda: self._render_chunk(generation, visible, end, slot)
+                )
+            else:
+                # Cards left over by skipped prompts
+                for card in self._card_pool[slot : len(visible)]:
+                    card.hide()
+        except Exception as e:
             logger.error(f"Error updating prompts list: [{type(e)}]: {e}")
             QMessageBox.critical(self, "Error", f"Error updating prompts list: {e}")
 
     def on_prompt_move(self, from_index, to_index):
         logger.debug(f"on_prompt_move: {from_index} -> {to_index}")
+        # Indexes of cards not bound yet by the current render are stale
+        if not (
+            0 <= from_index < len(self.displayed_cards)
+            and 0 <= to_index < len(self.displayed_cards)
+        ):
+            logger.warning(f"Ignoring move of unbound card {from_index} -> {to_index}")
+            return
         to_card = self.displayed_cards[to_index]
         to_card.current_index = to_index
         from_card = self.displayed_cards.pop(from_index)
@@ -405,8 +473,14 @@ class MainFrame(QMainWindow):
             to_card.original_index,
         )
         self.displayed_cards.insert(to_index, from_card)
+        self.invalidate_tag_index()
+        # Save and relayout once for all moves dropped in this event loop pass
+        self._batch.add(0, self.save_prompts)
+        self._batch.add(1, self.refresh_display)
+
+    def save_prompts(self):
+        """Save the current prompts through the application"""
         self.app.save_prompts(self.prompts)
-        self.refresh_display()
 
     def mousePressEvent(self, event):
         """Handle mouse press events for dragging in overlay mode"""
@@ -424,6 +498,9 @@ class MainFrame(QMainWindow):
         try:
             if self.is_overlay and event.button() == Qt.MouseButton.LeftButton:
                 self.dragging = False
+                # Apply the last position that was below the move threshold
+                self._drag_timer.stop()
+                self._apply_drag_move()
                 self.setCursor(Qt.CursorShape.ArrowCursor)
         except Exception as e:
             logger.error(f"Error in mouse release: {e}")
@@ -431,40 +508,54 @@ class MainFrame(QMainWindow):
 
     def mouseMoveEvent(self, event):
         """Handle mouse move events for dragging"""
+        if not self.is_overlay:
+            super().mouseMoveEvent(event)
+            return
         try:
-            if (
-                self.is_overlay
-                and self.dragging
-                and event.buttons() & Qt.MouseButton.LeftButton
-            ):
-                # Calculate new position ensuring we don't go off-screen
-                global_pos = event.globalPosition().toPoint()
-                new_pos = global_pos - self.drag_offset
+            if self.dragging and event.buttons() & Qt.MouseButton.LeftButton:
+                self._drag_move_pending = True
+                # The position itself is read from the cursor on the timer tick
+                if not self._drag_timer.isActive() and (
+                    event.globalPosition().toPoint() - self.drag_offset - self.pos()
+                ).manhattanLength() > self.drag_move_threshold:
+                    self._drag_timer.start(self.drag_move_interval)
+        except Exception as e:
+            logger.error(f"Error in mouse move: {e}")
+        super().mouseMoveEvent(event)
 
-                # Get screen geometry to constrain movement
-                from PySide6.QtWidgets import QApplication
+    def _apply_drag_move(self):
+        """Move the overlay to follow the cursor during a pending drag"""
+        try:
+            if not self._drag_move_pending:
+                return
+            self._drag_move_pending = False
+            new_pos = QCursor.pos() - self.drag_offset
 
-                screen = QApplication.primaryScreen().geometry()
-                window_size = self.size()
+            # Get screen geometry to constrain movement
+            screen = QApplication.primaryScreen().geometry()
+            window_size = self.size()
 
-                # Constrain to screen bounds
-                new_pos.setX(
-                    max(0, min(new_pos.x(), screen.width() - window_size.width()))
-                )
-                new_pos.setY(
-                    max(0, min(new_pos.y(), screen.height() - window_size.height()))
-                )
+            # Constrain to screen bounds
+            new_pos.setX(
+                max(0, min(new_pos.x(), screen.width() - window_size.width()))
+            )
+            new_pos.setY(
+                max(0, min(new_pos.y(), screen.height() - window_size.height()))
+            )
 
-                self.move(new_pos)
+            # Nothing to do when the clamped position did not change
+            if new_pos == self.pos():
+                return
+            self.move(new_pos)
         except Exception as e:
             logger.error(f"Error in mouse move: {e}")
-        super().mouseMoveEvent(event)
 
     def enterEvent(self, event):
         """Handle mouse entering window - for overlay mode enhancements"""
         try:
-            if self.is_overlay:
+            if self.is_overlay and not self._hover_state:
                 # Make window slightly more opaque when hovered
+                self._hover_state = True
                 self.setWindowOpacity(0.95)
         except Exception as e:
             logger.error(f"Error in enter event: {e}")
@@ -473,8 +564,9 @@ class MainFrame(QMainWindow):
     def leaveEvent(self, event):
         """Handle mouse leaving window - for overlay mode enhancements"""
         try:
-            if self.is_overlay:
+            if self.is_overlay and self._hover_state:
                 # Return to normal opacity when not hovered
+                self._hover_state = False
                 self.setWindowOpacity(0.86)
         except Exception as e:
             logger.error(f"Error in leave event: {e}")
@@ -482,6 +574,8 @@ class MainFrame(QMainWindow):
 
     def cleanup(self):
         logger.debug("Cleaning up window...")
+        # Cancel chunked card rendering still pending for the old widgets
+        self._render_generation += 1
         logger.debug("Threads: %s", threading.enumerate())
         try:
             self.search_ctrl.textChanged.disconnect()
@@ -492,9 +586,10 @@ class MainFrame(QMainWindow):
                 raise
         for dialog in self.findChildren(QDialog):
             dialog.close()
-        for child in self.findChildren(QWidget):
-            if hasattr(child, "cleanup"):
-                child.cleanup()
+        for card in self._card_pool:
+            card.cleanup()
+        self._card_pool = []
+        self.displayed_cards = []
         for child in self.findChildren(QAbstractButton):
             try:
                 child.clicked.disconnect()
@@ -560,6 +655,7 @@ class MainFrame(QMainWindow):
                     | Qt.WindowType.Tool  # Prevents taskbar entry
                 )
                 self.setWindowOpacity(0.86)  # Semi-transparent.
+                self._hover_state = False
                 # Make it narrower in overlay mode
                 self.resize(500, 500)
                 # Move to configured corner
@@ -587,8 +683,6 @@ class MainFrame(QMainWindow):
 
             self.show()  # Required after changing window flags
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             logger.critical(f"Error applying overlay mode: {e}")
             QMessageBox.critical(self, "Error", f"Error applying overlay mode: {e}")
 
@@ -696,8 +790,6 @@ class MainFrame(QMainWindow):
             if self.content_widget.layout() is not None:
                 self.content_widget.layout().update()
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Error", f"Error toggling tags panel: {e}")
 
     def show_settings(self, event):
@@ -716,15 +808,11 @@ class MainFrame(QMainWindow):
                 self.config_manager.save_config()
 
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Error", f"Error showing settings: {e}")
 
     def show_about(self, event):
         """Show about dialog"""
         try:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.information(
                 self,
                 "About Climpt",
@@ -736,10 +824,6 @@ class MainFrame(QMainWindow):
     def show_copied_message(self):
         """Show 'Copied!' message"""
         try:
-            from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
-            from PySide6.QtCore import QTimer
-            from PySide6.QtGui import QPalette
-
             # Create a temporary message widget
             msg_widget = QWidget(self)
             style_manager.attach(msg_widget, "copied_message")
@@ -790,8 +874,6 @@ class MainFrame(QMainWindow):
         """Move overlay window to configured corner"""
         try:
             corner = self.overlay_corner
-            from PySide6.QtWidgets import QApplication
-
             screen = QApplication.primaryScreen().geometry()
             window_size = self.size()
             self.previous_pos = self.pos()
@@ -852,22 +934,32 @@ class MainFrame(QMainWindow):
 
             self.update_prompts_list()
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Error", f"Error filtering prompts: {e}")
 
+    def get_tag_index(self):
+        """
+        Get a mapping of tag to the indexes of prompts having that tag.
+
+        Prompts without tags are listed under "No tags". The mapping is built
+        lazily and reset by invalidate_tag_index whenever prompts change.
+        """
+        if self._tag_index is None:
+            self._tag_index = {}
+            for i, prompt in enumerate(self.prompts):
+                for tag in prompt.get("tags") or ["No tags"]:
+                    self._tag_index.setdefault(tag, set()).add(i)
+        return self._tag_index
+
+    def invalidate_tag_index(self):
+        self._tag_index = None
+
     def on_tag_filter(self, tag):
         try:
-            if tag == "No tags":
-                self.filtered_prompts = {
-                    i for i, p in enumerate(self.prompts) if not p.get("tags")
-                }
-                self.search_ctrl.setText("#No tags")
-            else:
-                self.filtered_prompts = {
-                    i for i, p in enumerate(self.prompts) if tag in p.get("tags", [])
-                }
-                self.search_ctrl.setText(f"#{tag}")
+            self.filtered_prompts = set(self.get_tag_index().get(tag, ()))
+            # The filter is already applied, don't re-run it as a text search
+            self.search_ctrl.blockSignals(True)
+            self.search_ctrl.setText(f"#{tag}")
+            self.search_ctrl.blockSignals(False)
             self.update_prompts_list()
         except Exception as e:
             logger.error(f"Error in tag filter: {e}")
@@ -878,16 +970,12 @@ class MainFrame(QMainWindow):
             if success:
                 self.show_copied_message()
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Error", f"Error copying prompt: {e}")
 
     def on_add_prompt(self):
         try:
             self.edit_prompt(None)
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Error", f"Error adding prompt: {e}")
 
     def edit_prompt(self, prompt):
@@ -896,9 +984,14 @@ class MainFrame(QMainWindow):
             if dialog.exec():
                 try:
                     data = dialog.get_data()
-                    if data["id"] is None:
-                        # New prompt
+                    is_new = data["id"] is None
+                    if is_new:
                         data["id"] = max([p["id"] for p in self.prompts], default=0) + 1
+                    if not validate_prompt(data):
+                        QMessageBox.warning(self, "Error", "Invalid prompt data")
+                        return
+                    if is_new:
+                        # New prompt
                         self.prompts.append(data)
                     else:
                         # Update existing
@@ -906,6 +999,7 @@ class MainFrame(QMainWindow):
                             if p["id"] == data["id"]:
                                 self.prompts[i] = data
                                 break
+                    self.invalidate_tag_index()
 
                     self.app.save_prompts(self.prompts)
                     self.filtered_prompts = set(
@@ -914,26 +1008,21 @@ class MainFrame(QMainWindow):
                     self.refresh_display()
                     self.search_ctrl.setText("")
                 except Exception as e:
-                    from PySide6.QtWidgets import QMessageBox
-
                     QMessageBox.critical(self, "Error", f"Error saving prompt: {e}")
 
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Error", f"Error editing prompt: {e}")
 
     def delete_prompt(self, prompt_id):
         try:
             self.prompts = [p for p in self.prompts if p["id"] != prompt_id]
+            self.invalidate_tag_index()
             self.filtered_prompts = {
                 i for i, p in enumerate(self.prompts) if p["id"] != prompt_id
             }
             self.app.save_prompts(self.prompts)
             self.refresh_display()
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Error", f"Error deleting prompt: {e}")
 
     def toggle_overlay_from_hotkey(self):
@@ -945,7 +1034,5 @@ class MainFrame(QMainWindow):
             self.is_overlay = not self.is_overlay
             self.apply_overlay_mode()
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             logger.error(f"Error toggling overlay: {e}")
             QMessageBox.critical(self, "Error", f"Error toggling overlay: {e}")
@@ -1,26 +1,27 @@
 import logging
-import time
 from PySide6.QtWidgets import (
-    QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
     QMenu,
-    QApplication,
     QFrame,
+    QMessageBox,
 )
-from PySide6.QtCore import Qt, QPoint, Signal, QMimeData
-from PySide6.QtGui import QFont, QCursor, QMouseEvent, QContextMenuEvent
-from PySide6.QtGui import QDrag, QPixmap
+from PySide6.QtCore import Qt, Signal, QMimeData, QByteArray, QPoint
+from PySide6.QtGui import QDrag, QPixmap, QPainter
 from gui.styles import style_manager
+from gui.utils.fonts import bold_font
 
 logger = logging.getLogger(__name__)
 
+CARD_INDEX_MIME_TYPE = "application/x-promptcard-index"
+
 
 class PromptCard(QFrame):
     clicktime = 100  # (milliseconds)
     card_moved = Signal(int, int)
+    tag_clicked = Signal(str)
 
     def __init__(
         self,
@@ -48,21 +49,25 @@ class PromptCard(QFrame):
         self.on_edit = on_edit
         self.on_delete = on_delete  # This is MainFrame.delete_prompt
         self.dragging = False
-        self.drag_start_position = None
+        self.drag_start_position = QPoint()
         self.original_index = original_index
         self.current_index = current_index
+        self.tag_blobs = []
+        self._drag_pixmap = None
+        self._menu = None
         self.setAcceptDrops(True)
         self.setup_ui()
+        self.bind(prompt, original_index, current_index)
 
     def cleanup(self):
         logger.debug("triggering cleanup for PromptCard")
         self.card_moved.disconnect()
+        self.tag_clicked.disconnect()
         self.deleteLater()
 
     def setup_ui(self):
-        wrapper = QWidget()
-        wrapper.setObjectName("PromptCard")
-        style_manager.attach(wrapper, "prompt_card")
+        # Styled (including hover) by the prompts container stylesheet
+        self.setObjectName("PromptCard")
 
         main_layout = QVBoxLayout()
         main_layout.addStretch()
@@ -71,72 +76,158 @@ class PromptCard(QFrame):
         prompt_layout.setSpacing(5)
 
         # Header with bold font
-        header = QLabel(self.prompt["name"])
-        header_font = QFont()
-        header_font.setBold(True)
-        header_font.setPointSize(11)
-        header.setFont(header_font)
-        style_manager.attach(header, "prompt_header")
-        header.setWordWrap(True)
+        self.header = QLabel()
+        self.header.setFont(bold_font(11))
+        self.header.setObjectName("PromptHeader")
+        self.header.setWordWrap(True)
 
-        prompt_layout.addWidget(header)
+        prompt_layout.addWidget(self.header)
 
         # Content - first few lines
-        content_lines = self.prompt["content"].split("\n")
-        content_preview = "\n".join(content_lines[:3])  # First three lines
-        if len(content_lines) > 3:
-            content_preview += "..."
-
-        content = QLabel(content_preview)
-        content.setWordWrap(True)
-        content.setMinimumWidth(300)
-        content.setMinimumHeight(80)
-        prompt_layout.addWidget(content)
-        style_manager.attach(content, "prompt_card_content")
+        self.content = QLabel()
+        self.content.setWordWrap(True)
+        self.content.setMinimumWidth(300)
+        self.content.setMinimumHeight(80)
+        self.content.setObjectName("PromptCardContent")
+        prompt_layout.addWidget(self.content)
 
         main_layout.addLayout(prompt_layout)
 
-        # Tags as blobs
-        if self.prompt.get("tags"):
-            tags_layout = QHBoxLayout()
-            tags_layout.setSpacing(4)
-            for tag in self.prompt["tags"]:
-                tag_blob = QPushButton(f"#{tag}")
-                style_manager.attach(tag_blob, "tag_blob")
-                # Bind click to copy tag to search
-                tag_blob.clicked.connect(
-                    lambda checked, t=tag: self.copy_tag_to_search(t)
+        # Tags as blobs, filled in by bind()
+        self.tags_layout = QHBoxLayout()
+        self.tags_layout.setSpacing(4)
+        self.tags_layout.addStretch()
+        main_layout.addLayout(self.tags_layout)
+
+        self.setLayout(main_layout)
+        self.setFixedHeight(150)
+
+    def bind(self, prompt, original_index, current_index):
+        """
+        Show another prompt in this card without recreating its widgets.
+
+        Args:
+            prompt: The prompt data to display in this card.
+            original_index: Index of the prompt in the full prompts list.
+            current_index: Index of the card among the displayed cards.
+        """
+        self.prompt = prompt
+        self.original_index = original_index
+        self.current_index = current_index
+        self._drag_pixmap = None
+        # QDrag.exec swallows the release that would end a drag of the
+        # previous prompt
+        self.dragging = False
+
+        self.header.setText(prompt["name"])
+
+        self.content.setText(self.get_content_preview(prompt["content"]))
+
+        tags = prompt.get("tags") or []
+        if [blob.text() for blob in self.tag_blobs] != [f"#{tag}" for tag in tags]:
+            for blob in self.tag_blobs:
+                self.tags_layout.removeWidget(blob)
+                blob.deleteLater()
+            self.tag_blobs = []
+            for tag in tags:
+                # Parented up front so the layout does not reparent each blob
+                tag_blob = QPushButton(f"#{tag}", self)
+                tag_blob.setObjectName("TagBlob")
+                tag_blob.setProperty("tagName", tag)
+                # Bind click to filter prompts by this tag
+                tag_blob.clicked.connect(self._on_tag_clicked)
+                self.tags_layout.insertWidget(len(self.tag_blobs), tag_blob)
+                self.tag_blobs.append(tag_blob)
+
+    @staticmethod
+    def get_content_preview(content, max_lines=3):
+        """
+        Get the first lines of a prompt content for display in the card.
+
+        Args:
+            content (str): Full prompt content.
+            max_lines (int): Number of lines to keep.
+
+        Returns:
+            str: The first max_lines lines, followed by "..." if truncated.
+        """
+        # Find the end of the last kept line without splitting the content
+        end = -1
+        for _ in range(max_lines):
+            end = content.find("\n", end + 1)
+            if end == -1:
+                return content
+        return content[:end] + "..."
+
+    def _on_tag_clicked(self):
+        self.tag_clicked.emit(self.sender().property("tagName"))
+
+    def _build_menu(self):
+        """Create the context menu, reused for every right-click"""
+        menu = QMenu(self)
+        style_manager.attach(menu, "context_menu")
+
+        edit_item = menu.addAction("Edit Prompt")
+        delete_item = menu.addAction("Delete Prompt")
+
+        # Add separator and copy content option
+        menu.addSeparator()
+        copy_content_item = menu.addAction("Copy Content")
+
+        # Connect menu actions
+        edit_item.triggered.connect(self._on_edit)
+        delete_item.triggered.connect(self._on_delete)
+        copy_content_item.triggered.connect(self._on_copy_content)
+        return menu
+
+    def _on_edit(self):
+        try:
+            if self.on_edit:  # Check if callback exists
+                self.on_edit(self.prompt)
+            else:
+                QMessageBox.warning(self, "Error", "Edit callback not set")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error editing prompt: {e}")
+
+    def _on_delete(self):
+        if not self.on_delete:
+            QMessageBox.warning(self, "Error", "Delete callback not set")
+            return
+        try:
+            # Show confirmation dialog
+            if (
+                QMessageBox.question(
+                    self,
+                    "Confirm Delete",
+                    f"Are you sure you want to delete '{self.prompt['name']}'?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No,
                 )
-                tags_layout.addWidget(tag_blob)
-            tags_layout.addStretch()
-            main_layout.addLayout(tags_layout)
-
-        wrapper.setLayout(main_layout)
-        wrapper.setFixedHeight(150)
-        layout = QVBoxLayout()
-        layout.addWidget(wrapper)
-        self.setLayout(layout)
-        self.raise_()
-
-    def copy_tag_to_search(self, tag):
-        """Copy tag to search box"""
+                != QMessageBox.StandardButton.Yes
+            ):
+                return
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error in delete confirmation: {e}")
+            logger.error(f"Detailed confirmation error: {e}")
+            return
+
+        # Call the delete callback passed from MainFrame
         try:
-            # Find the main window to access search control
-            parent = self.parent()
-            while parent and not hasattr(parent, "search_ctrl"):
-                parent = parent.parent()
-
-            if parent and hasattr(parent, "search_ctrl"):
-                search_ctrl = parent.search_ctrl
-                search_ctrl.setText(f"#{tag}")
-
-                # Trigger search
-                if hasattr(parent, "on_search"):
-                    parent.on_search()
+            self.on_delete(self.prompt["id"])
+        except Exception as delete_error:
+            QMessageBox.critical(
+                self, "Error", f"Error deleting prompt in callback: {delete_error}"
+            )
+            logger.error(f"Detailed delete error: {delete_error}")
+
+    def _on_copy_content(self):
+        try:
+            if self.on_click:  # Check if callback exists
+                self.on_click(self.prompt)  # This copies to clipboard
             else:
-                logger.error("Could not find search control in parent hierarchy")
+                QMessageBox.warning(self, "Error", "Copy callback not set")
         except Exception as e:
-            logger.error(f"Error copying tag to search: {e}")
+            QMessageBox.critical(self, "Error", f"Error copying content: {e}")
 
     def contextMenuEvent(self, event):
         """Show context menu"""
@@ -144,99 +235,13 @@ class PromptCard(QFrame):
             # If dragging, ignore right click to avoid context menu during drag
             return
         try:
-            from PySide6.QtWidgets import QMenu
-
-            menu = QMenu(self)
-            style_manager.attach(menu, "context_menu")
-
-            edit_item = menu.addAction("Edit Prompt")
-            delete_item = menu.addAction("Delete Prompt")
-
-            # Add separator and copy content option
-            menu.addSeparator()
-            copy_content_item = menu.addAction("Copy Content")
-
-            def on_edit():
-                try:
-                    if self.on_edit:  # Check if callback exists
-                        self.on_edit(self.prompt)
-                    else:
-                        from PySide6.QtWidgets import QMessageBox
-
-                        QMessageBox.warning(self, "Error", "Edit callback not set")
-                except Exception as e:
-                    from PySide6.QtWidgets import QMessageBox
-
-                    QMessageBox.critical(self, "Error", f"Error editing prompt: {e}")
-
-            def on_delete():
-                try:
-                    from PySide6.QtWidgets import QMessageBox
-
-                    # Show confirmation dialog
-                    reply = QMessageBox.question(
-                        self,
-                        "Confirm Delete",
-                        f"Are you sure you want to delete '{self.prompt['name']}'?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                        QMessageBox.StandardButton.No,
-                    )
-
-                    if reply == QMessageBox.StandardButton.Yes:
-                        # Ensure the callback exists before calling
-                        if self.on_delete:
-                            # Call the delete callback passed from MainFrame
-                            try:
-                                self.on_delete(self.prompt["id"])
-                            except Exception as delete_error:
-                                QMessageBox.critical(
-                                    self,
-                                    "Error",
-                                    f"Error deleting prompt in callback: {delete_error}",
-                                )
-                                logger.error(f"Detailed delete error: {delete_error}")
-                        else:
-                            QMessageBox.warning(
-                                self, "Error", "Delete callback not set"
-                            )
-
-                except Exception as e:
-                    from PySide6.QtWidgets import QMessageBox
-
-                    QMessageBox.critical(
-                        self, "Error", f"Error in delete confirmation: {e}"
-                    )
-                    logger.error(f"Detailed confirmation error: {e}")
-
-            def on_copy_content():
-                try:
-                    if self.on_click:  # Check if callback exists
-                        self.on_click(self.prompt)  # This copies to clipboard
-                    else:
-                        from PySide6.QtWidgets import QMessageBox
-
-                        QMessageBox.warning(self, "Error", "Copy callback not set")
-                except Exception as e:
-                    from PySide6.QtWidgets import QMessageBox
-
-                    QMessageBox.critical(self, "Error", f"Error copying content: {e}")
-
-            # Connect menu actions
-            edit_item.triggered.connect(on_edit)
-            delete_item.triggered.connect(on_delete)
-            copy_content_item.triggered.connect(on_copy_content)
+            if self._menu is None:
+                self._menu = self._build_menu()
 
             # Show the popup menu
-            if isinstance(event, QContextMenuEvent):
-                menu.exec(event.globalPos())
-            else:
-                from PySide6.QtGui import QCursor
-
-                menu.exec(QCursor.pos())
+            self._menu.exec(event.globalPos())
 
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Error", f"Error showing context menu: {e}")
             logger.error(f"Detailed menu error: {e}")
 
@@ -247,7 +252,8 @@ class PromptCard(QFrame):
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        if not (event.buttons() & Qt.MouseButton.LeftButton):
+        # Nothing to do without a held button or once the press started a drag
+        if self.dragging or not (event.buttons() & Qt.MouseButton.LeftButton):
             return
         if (
             event.position().toPoint() - self.drag_start_position
@@ -257,25 +263,42 @@ class PromptCard(QFrame):
         # Create drag operation
         drag = QDrag(self)
         mime_data = QMimeData()
-        mime_data.setText(str(self.current_index))
+        mime_data.setData(
+            CARD_INDEX_MIME_TYPE, QByteArray(self.current_index.to_bytes(4, "little"))
+        )
         drag.setMimeData(mime_data)
 
-        # Create pixmap for visual feedback
-        pixmap = QPixmap(self.size())
-        self.render(pixmap)
-        drag.setPixmap(pixmap)
-        drag.setHotSpot(event.position().toPoint())
+        # Create a half-size thumbnail for visual feedback, rendered once per
+        # prompt and size
+        if self._drag_pixmap is None:
+            self._drag_pixmap = QPixmap(self.size() / 2)
+            self._drag_pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(self._drag_pixmap)
+            painter.scale(0.5, 0.5)
+            self.render(painter)
+            painter.end()
+        drag.setPixmap(self._drag_pixmap)
+        drag.setHotSpot(event.position().toPoint() / 2)
 
         # Execute drag operation
         drag.exec(Qt.DropAction.MoveAction)
 
+    def resizeEvent(self, event):
+        self._drag_pixmap = None
+        super().resizeEvent(event)
+
     def dragEnterEvent(self, event):
-        if event.mimeData().hasText() and event.source() != self:
+        if (
+            event.mimeData().hasFormat(CARD_INDEX_MIME_TYPE)
+            and event.source() != self
+        ):
             event.acceptProposedAction()
 
     def dropEvent(self, event):
-        if event.mimeData().hasText():
-            from_index = int(event.mimeData().text())
+        if event.mimeData().hasFormat(CARD_INDEX_MIME_TYPE):
+            from_index = int.from_bytes(
+                bytes(event.mimeData().data(CARD_INDEX_MIME_TYPE))[:4], "little"
+            )
             logger.debug(
                 f"Emitting card moved signal from {from_index} to {self.current_index}"
             )
@@ -285,5 +308,5 @@ class PromptCard(QFrame):
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and not self.dragging:
             # Handle click event
-            if hasattr(self, "on_click") and callable(self.on_click):
+            if self.on_click:
                 self.on_click(self.prompt)
@@ -2,19 +2,22 @@ from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
+    QFormLayout,
     QLabel,
     QLineEdit,
     QPushButton,
     QComboBox,
     QWidget,
-    QFrame,
 )
-from PySide6.QtGui import QFont
 from gui.utils.toggle_switch import ToggleSwitch
+from gui.utils.fonts import bold_font
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Overlay corners in combo box order, the last one is the fallback
+_CORNERS = ("Top Left", "Top Right", "Bottom Left", "Bottom Right", "Leave")
+
 
 class SettingsDialog(QDialog):
     def __init__(self, parent, config_manager):
@@ -31,54 +34,41 @@ class SettingsDialog(QDialog):
 
         # Hotkeys section
         hotkeys_label = QLabel("Hotkeys")
-        hotkeys_font = QFont()
-        hotkeys_font.setBold(True)
-        hotkeys_label.setFont(hotkeys_font)
+        hotkeys_label.setFont(bold_font())
         layout.addWidget(hotkeys_label)
 
-        # Overlay hotkey
-        overlay_layout = QHBoxLayout()
-        overlay_layout.addWidget(QLabel("Toggle Overlay:"), 0)
+        # Hotkey rows
+        hotkeys_form = QFormLayout()
         self.overlay_hotkey = QLineEdit(
             self.config_manager.get("hotkeys", "overlay", fallback="alt+p")
         )
-        overlay_layout.addWidget(self.overlay_hotkey, 1)
-        layout.addLayout(overlay_layout)
-
-        # Tags hotkey
-        tags_layout = QHBoxLayout()
-        tags_layout.addWidget(QLabel("Toggle Tags:"), 0)
+        hotkeys_form.addRow("Toggle Overlay:", self.overlay_hotkey)
         self.tags_hotkey = QLineEdit(
             self.config_manager.get("hotkeys", "tags", fallback="alt+t")
         )
-        tags_layout.addWidget(self.tags_hotkey, 1)
-        layout.addLayout(tags_layout)
+        hotkeys_form.addRow("Toggle Tags:", self.tags_hotkey)
+        layout.addLayout(hotkeys_form)
 
         # Add some spacing
         layout.addSpacing(10)
 
         # Position section
         position_label = QLabel("Overlay Position")
-        position_font = QFont()
-        position_font.setBold(True)
-        position_label.setFont(position_font)
+        position_label.setFont(bold_font())
         layout.addWidget(position_label)
 
         # Corner selection
-        corner_layout = QHBoxLayout()
-        corner_layout.addWidget(QLabel("Corner:"), 0)
+        corner_form = QFormLayout()
         self.corner_choice = QComboBox()
-        self.corner_choice.addItems(
-            ["Top Left", "Top Right", "Bottom Left", "Bottom Right", "Leave"]
-        )
+        self.corner_choice.addItems(_CORNERS)
         current_corner = self.config_manager.get("overlay", "corner", fallback="Leave")
-        index = self.corner_choice.findText(current_corner)
-        if index >= 0:
-            self.corner_choice.setCurrentIndex(index)
-        else:
-            self.corner_choice.setCurrentIndex(self.corner_choice.findText("Leave"))
-        corner_layout.addWidget(self.corner_choice, 1)
-        layout.addLayout(corner_layout)
+        self.corner_choice.setCurrentIndex(
+            _CORNERS.index(current_corner)
+            if current_corner in _CORNERS
+            else len(_CORNERS) - 1
+        )
+        corner_form.addRow("Corner:", self.corner_choice)
+        layout.addLayout(corner_form)
 
         transform_into_side_panel_layout = QHBoxLayout()
         transform_into_side_panel_layout.addWidget(
@@ -100,34 +90,30 @@ class SettingsDialog(QDialog):
             self.transform_into_side_panel_switch
         )
 
+        layout.addLayout(transform_into_side_panel_layout)
+
+        # Side panel settings are only built once the side panel is enabled
+        self.side_panel_settings = None
+        self.leave_holes_switch = None
+        side_panel_settings_index = layout.count()
+
         def show_hide_side_panel_settings(state):
             if state:
+                if self.side_panel_settings is None:
+                    self.side_panel_settings = self._build_side_panel_settings()
+                    layout.insertWidget(
+                        side_panel_settings_index, self.side_panel_settings
+                    )
                 self.side_panel_settings.show()
-            else:
+            elif self.side_panel_settings is not None:
                 self.side_panel_settings.hide()
 
-        layout.addLayout(transform_into_side_panel_layout)
-
-        self.side_panel_settings = QWidget()
-        side_panel_settings_layout = QVBoxLayout()
-        leave_holes_layout = QHBoxLayout()
-        leave_holes_layout.addWidget(
-            QLabel("Leave holes for close button and taskbar:"), 0
-        )
-        self.leave_holes_switch = ToggleSwitch(
-            self.config_manager.get("overlay", "side_panel_leave_holes", fallback=False)
-        )
-        leave_holes_layout.addWidget(self.leave_holes_switch)
-        side_panel_settings_layout.addLayout(leave_holes_layout)
-        self.side_panel_settings.setLayout(side_panel_settings_layout)
-        layout.addWidget(self.side_panel_settings)
         self.transform_into_side_panel_switch.stateChanged.connect(
             show_hide_side_panel_settings
         )
-        if self.transform_into_side_panel_switch.getState():
-            self.side_panel_settings.show()
-        else:
-            self.side_panel_settings.hide()
+        show_hide_side_panel_settings(
+            self.transform_into_side_panel_switch.getState()
+        )
 
         # Add some spacing
         layout.addSpacing(20)
@@ -149,6 +135,22 @@ class SettingsDialog(QDialog):
 
         self.setLayout(layout)
 
+    def _build_side_panel_settings(self):
+        """Create the widget holding the side panel specific settings"""
+        side_panel_settings = QWidget(self)
+        side_panel_settings_layout = QVBoxLayout()
+        leave_holes_layout = QHBoxLayout()
+        leave_holes_layout.addWidget(
+            QLabel("Leave holes for close button and taskbar:"), 0
+        )
+        self.leave_holes_switch = ToggleSwitch(
+            self.config_manager.get("overlay", "side_panel_leave_holes", fallback=False)
+        )
+        leave_holes_layout.addWidget(self.leave_holes_switch)
+        side_panel_settings_layout.addLayout(leave_holes_layout)
+        side_panel_settings.setLayout(side_panel_settings_layout)
+        return side_panel_settings
+
     def on_ok(self):
         self.accept()
 
@@ -164,6 +166,12 @@ class SettingsDialog(QDialog):
             "overlay": {
                 "corner": self.corner_choice.currentText(),
                 "transform_into_side_panel": self.transform_into_side_panel_switch.getState(),
-                "side_panel_leave_holes": self.leave_holes_switch.getState(),
+                "side_panel_leave_holes": (
+                    self.leave_holes_switch.getState()
+                    if self.leave_holes_switch is not None
+                    else self.config_manager.get(
+                        "overlay", "side_panel_leave_holes", fallback=False
+                    )
+                ),
             },
         }
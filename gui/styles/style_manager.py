@@ -2,14 +2,22 @@
 
 import os
 import yaml
-from PySide6.QtCore import QFileSystemWatcher
+import shiboken6
+from PySide6.QtCore import QFileSystemWatcher, QTimer
 import logging
 from utils import correct_qss
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 
 class StyleManager:
+    reload_delay = 50  # (milliseconds)
+
     def __init__(self, styles_dir="gui/styles"):
         self.styles_dir = styles_dir
         self.themes_dir = os.path.join(styles_dir, "theme")
@@ -23,6 +31,12 @@ class StyleManager:
         self.watcher = QFileSystemWatcher()
         self.watcher.directoryChanged.connect(self._on_directory_changed)
         self.watcher.fileChanged.connect(self._on_file_changed)
+        # Editors emit several changes per save, reload once they settle
+        self._changed_paths = set()
+        self._reload_timer = QTimer()
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(self.reload_delay)
+        self._reload_timer.timeout.connect(self._flush_file_changes)
 
         # Watch style directories
         if os.path.exists(self.themes_dir):
@@ -30,39 +44,65 @@ class StyleManager:
         if os.path.exists(self.components_dir):
             self.watcher.addPath(self.components_dir)
 
+        # (mtime_ns, size) of watched style files, to ignore no-op changes
+        self._file_fingerprints = {}
+        for directory, extension in (
+            (self.themes_dir, ".yaml"),
+            (self.components_dir, ".qss"),
+        ):
+            for file in os.listdir(directory):
+                if file.endswith(extension):
+                    self._watch_file(os.path.join(directory, file))
+
         self.attached_objects = {}
+        # Rendered QSS per (component name, id of theme dict)
+        self._compiled = {}
+        # Brace-corrected QSS templates per component file, with their mtime
+        self._qss_cache = {}
+        # Style file names per directory, with the directory mtime
+        self._dir_cache = {}
+        # Parsed themes per theme name
+        self._theme_cache = {}
+        self.current_theme_name = "default"
         try:
-            self.current_theme = yaml.safe_load(
-                open(os.path.join(self.themes_dir, "default.yaml"), "r")
-            )
+            self.current_theme = self._load_theme("default")
         except FileNotFoundError:
             try:
-                self.current_theme_name = open(
-                    os.path.join(self.themes_dir, "default-theme-name"), "r"
-                ).read()
-                self.current_theme = yaml.safe_load(
-                    open(
-                        os.path.join(
-                            self.themes_dir, f"{self.current_theme_name}.yaml"
-                        ),
-                        "r",
-                    )
-                )
+                with open(
+                    os.path.join(self.themes_dir, "default-theme-name"),
+                    "r",
+                    encoding="utf-8",
+                ) as f:
+                    self.current_theme_name = f.read()
+                self.current_theme = self._load_theme(self.current_theme_name)
             except FileNotFoundError:
                 logger.warning("No default theme found. Trying random theme.")
                 for theme_file in os.listdir(self.themes_dir):
                     if theme_file.endswith(".yaml"):
-                        self.current_theme = yaml.safe_load(
-                            open(
-                                os.path.join(self.themes_dir, theme_file),
-                                "r",
-                            )
-                        )
+                        self.current_theme_name = theme_file[:-5]
+                        self.current_theme = self._load_theme(self.current_theme_name)
                         break
                 else:
                     logger.warning("No themes found. Using empty theme.")
+                    self.current_theme_name = None
                     self.current_theme = {}
 
+    def _load_theme(self, theme_name):
+        """
+        Load a theme, parsing its YAML file only the first time.
+
+        Args:
+            theme_name (str): Name of the theme file without extension.
+
+        Returns:
+            dict: Theme variables.
+        """
+        if theme_name not in self._theme_cache:
+            theme_file = os.path.join(self.themes_dir, theme_name + ".yaml")
+            with open(theme_file, "r", encoding="utf-8") as f:
+                self._theme_cache[theme_name] = yaml.load(f, Loader=_YamlLoader)
+        return self._theme_cache[theme_name]
+
     def get(self, component_name, theme=None):
         """
         Get style for a specific component.
@@ -78,32 +118,64 @@ class StyleManager:
 
         # Try theme-specific component file
         component_file = os.path.join(self.components_dir, f"{component_name}.qss")
-        if os.path.exists(component_file):
-            try:
-                with open(component_file, "r") as f:
-                    return correct_qss(f.read()).format(**theme)
-            except Exception as e:
-                logger.error(
-                    f"Error loading theme component style {component_file}: {e}"
-                )
+        try:
+            mtime = os.stat(component_file).st_mtime
+        except OSError:
+            return None
+
+        try:
+            cached = self._qss_cache.get(component_file)
+            if cached is None or cached[0] != mtime:
+                with open(component_file, "r", encoding="utf-8") as f:
+                    cached = (mtime, correct_qss(f.read()))
+                self._qss_cache[component_file] = cached
+            return cached[1].format(**theme)
+        except Exception as e:
+            logger.error(f"Error loading theme component style {component_file}: {e}")
 
         return None
 
     def attach(self, obj, name, theme=None, theme_persistent=False):
-        if name in self.attached_objects:
-            self.attached_objects[name].append(
-                {"obj": obj, "theme": theme, "theme_persistent": theme_persistent}
-            )
-        else:
-            self.attached_objects[name] = [
-                {"obj": obj, "theme": theme, "theme_persistent": theme_persistent}
-            ]
-        obj.setStyleSheet(self.get(name, theme))
-
-    def refresh_styles(self):
-        for name, objects in self.attached_objects.items():
+        key = (name, id(theme or self.current_theme))
+        if key not in self._compiled:
+            self._compiled[key] = self.get(name, theme)
+        # "qss" is the stylesheet last set on the object
+        self.attached_objects.setdefault(name, []).append(
+            {
+                "obj": obj,
+                "theme": theme,
+                "theme_persistent": theme_persistent,
+                "qss": self._compiled[key],
+            }
+        )
+        obj.setStyleSheet(self._compiled[key])
+
+    def refresh_styles(self, names=None):
+        """
+        Re-apply the stylesheets of attached objects.
+
+        Args:
+            names (iterable, optional): Components to refresh. If None, all
+                attached components are refreshed.
+        """
+        if names is None:
+            names = list(self.attached_objects)
+        # Render each (component, theme) pair once for all objects sharing it
+        rendered = {}
+        for name in names:
+            objects = self.attached_objects.get(name, [])
+            # Forget objects deleted since they were attached, e.g. toasts
+            objects[:] = [obj for obj in objects if shiboken6.isValid(obj["obj"])]
             for obj in objects:
-                obj["obj"].setStyleSheet(self.get(name, obj["theme"]))
+                key = (name, id(obj["theme"] or self.current_theme))
+                if key not in rendered:
+                    rendered[key] = self.get(name, obj["theme"])
+                # Setting a stylesheet makes Qt re-polish, skip it if unchanged
+                if obj["qss"] == rendered[key]:
+                    continue
+                obj["obj"].setStyleSheet(rendered[key])
+                obj["qss"] = rendered[key]
+        self._compiled.update(rendered)
 
     def apply_theme(self, theme_name):
         """
@@ -114,52 +186,125 @@ class StyleManager:
             app (QApplication, optional): Application instance. If None, uses current app.
         """
 
-        theme_file = os.path.join(self.themes_dir, theme_name + ".yaml")
-
-        self.current_theme = yaml.safe_load(open(theme_file, "r"))
+        self.current_theme = self._load_theme(theme_name)
+        self.current_theme_name = theme_name
+        self._compiled.clear()
         for name, objects in self.attached_objects.items():
             for obj in objects:
                 if not obj["theme_persistent"]:
                     obj["theme"] = self.current_theme
         self.refresh_styles()
 
+    def _list_dir(self, directory, extension):
+        """
+        List the names of the files with an extension in a style directory.
+
+        Results are cached until the modification time of the directory
+        changes.
+
+        Args:
+            directory (str): Directory to scan.
+            extension (str): File extension to keep, including the dot.
+
+        Returns:
+            list: File names without their extension.
+        """
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return []
+        cached = self._dir_cache.get(directory)
+        if cached is None or cached[0] != mtime:
+            with os.scandir(directory) as entries:
+                names = [
+                    entry.name[: -len(extension)]
+                    for entry in entries
+                    if entry.name.endswith(extension) and entry.is_file()
+                ]
+            cached = self._dir_cache[directory] = (mtime, names)
+        return list(cached[1])
+
     def get_available_themes(self):
         """Get list of available themes"""
-        themes = []
-        if os.path.exists(self.themes_dir):
-            for item in os.listdir(self.themes_dir):
-                if item.endswith(".yaml"):
-                    themes.append(item[:-5])
-        return themes
+        return self._list_dir(self.themes_dir, ".yaml")
 
     def get_available_components(self):
         """Get list of styled components"""
-        components = set()
-
-        # Check global components
-        if os.path.exists(self.components_dir):
-            for file in os.listdir(self.components_dir):
-                if file.endswith(".qss"):
-                    components.add(file[:-4])  # Remove .qss extension
-        return list(components)
+        return self._list_dir(self.components_dir, ".qss")
 
     def _on_directory_changed(self, path):
         """Handle directory changes (files added/removed)"""
         logger.debug(f"Directory changed: {path}")
+        self._dir_cache.pop(path, None)
         # You could trigger a theme reload here if needed
 
+    def _watch_file(self, path):
+        """Watch a style file and remember its current fingerprint"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        self._file_fingerprints[path] = (st.st_mtime_ns, st.st_size)
+        self.watcher.addPath(path)
+
     def _on_file_changed(self, path):
         """Handle file changes (live reloading)"""
         logger.debug(f"Style file changed: {path}")
-        # Reload current theme when style files change
-        if self.current_theme:
-            self.apply_theme(self.current_theme)
+        self._changed_paths.add(path)
+        self._reload_timer.start()
+
+    def _flush_file_changes(self):
+        """Reload what depends on the files changed since the last flush"""
+        paths, self._changed_paths = self._changed_paths, set()
+        changed_components = []
+        theme_changed = False
+        reload_theme = False
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            fingerprint = (st.st_mtime_ns, st.st_size)
+            if self._file_fingerprints.get(path) == fingerprint:
+                continue
+            self._file_fingerprints[path] = fingerprint
+            # Editors saving through a new file make the watcher drop the path
+            if path not in self.watcher.files():
+                self.watcher.addPath(path)
+
+            name, extension = os.path.splitext(os.path.basename(path))
+            if extension == ".qss":
+                self._qss_cache.pop(path, None)
+                changed_components.append(name)
+            elif extension == ".yaml":
+                self._theme_cache.pop(name, None)
+                theme_changed = True
+                reload_theme = reload_theme or name == self.current_theme_name
+
+        # Drop rendered QSS built from the old files, even for components
+        # without attached objects, so later attach() calls render again
+        if theme_changed:
+            self._compiled.clear()
+        elif changed_components:
+            self._compiled = {
+                key: qss
+                for key, qss in self._compiled.items()
+                if key[0] not in changed_components
+            }
+
+        # Only reload what depends on the changed files
+        if reload_theme:
+            self.apply_theme(self.current_theme_name)
+        elif changed_components:
+            self.refresh_styles(changed_components)
 
     def clear(self):
         self.attached_objects = {}
+        self._compiled.clear()
 
     def cleanup(self):
         self.clear()
+        self._reload_timer.stop()
         self.watcher.directoryChanged.disconnect()
         self.watcher.fileChanged.disconnect()
         self.watcher.deleteLater()
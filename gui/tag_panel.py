@@ -1,20 +1,36 @@
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QHBoxLayout,
     QLabel,
     QPushButton,
-    QApplication,
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
 import colorsys
-import hashlib
 import logging
+import zlib
 from gui.styles import style_manager
+from gui.utils.fonts import bold_font
 
 logger = logging.getLogger(__name__)
 
+# Stylesheet of a tag button, filled with its color and hover color hex
+_TAG_QSS_TPL = """
+QPushButton {
+    background-color: %(c)s;
+    color: white;
+    border: none;
+    border-radius: 12px;
+    padding: 4px 12px;
+    font-size: 12px;
+    min-height: 25px;
+    text-align: left;
+}
+QPushButton:hover {
+    background-color: %(h)s;
+}
+"""
+
 
 class TagPanel(QWidget):
     def __init__(self, parent):
@@ -27,81 +43,94 @@ class TagPanel(QWidget):
         self.setLayout(self.layout)
         self.tag_buttons = {}
         self.on_tag_click_callback = None
+        # Tag colors are derived from the tag name only, so they never change
+        self._color_cache = {}  # tag -> (color, hover color hex)
+        self._style_cache = {}  # tag -> button stylesheet
 
         # Header
         header = QLabel("TAGS")
-        header_font = QFont()
-        header_font.setBold(True)
-        header.setFont(header_font)
+        header.setFont(bold_font())
         self.layout.addWidget(header)
+        # Tag buttons are inserted between the header and this stretch
+        self.layout.addStretch()
 
     def set_on_tag_click(self, callback):
         self.on_tag_click_callback = callback
 
     def update_tags(self, tag_counts):
-        # Clear existing buttons
-        self.tag_buttons.clear()
-
-        # Remove old items (keep header)
-        while self.layout.count() > 1:
-            item = self.layout.takeAt(1)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Add tags
-        sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-        for tag, count in sorted_tags:
-            btn = self.create_tag_button(tag, count)
-            btn.clicked.connect(lambda checked, t=tag: self.on_tag_click(t))
-            self.layout.addWidget(btn)
-            self.tag_buttons[tag] = btn
-
-        # Add "No tags" if needed
-        if "No tags" in tag_counts and tag_counts["No tags"] > 0:
-            btn = self.create_tag_button("No tags", tag_counts["No tags"])
-            btn.clicked.connect(lambda: self.on_tag_click("No tags"))
-            self.layout.addWidget(btn)
-
-        self.layout.addStretch()
+        # Repaint once after the whole rebuild instead of once per button
+        self.setUpdatesEnabled(False)
+        try:
+            # Sort tags by count, "No tags" always comes last
+            sorted_tags = sorted(
+                (item for item in tag_counts.items() if item[0] != "No tags"),
+                key=lambda x: x[1],
+                reverse=True,
+            )
+            if tag_counts.get("No tags", 0) > 0:
+                sorted_tags.append(("No tags", tag_counts["No tags"]))
+
+            # Remove buttons of tags that are gone
+            for tag in self.tag_buttons.keys() - {tag for tag, _ in sorted_tags}:
+                btn = self.tag_buttons.pop(tag)
+                self.layout.removeWidget(btn)
+                btn.deleteLater()
+
+            # Reuse the buttons of known tags, create the missing ones
+            for position, (tag, count) in enumerate(sorted_tags, start=1):
+                btn = self.tag_buttons.get(tag)
+                if btn is None:
+                    btn = self.create_tag_button(tag, count)
+                    self.tag_buttons[tag] = btn
+                else:
+                    btn.setText(self.get_tag_label(tag, count))
+                    if self.layout.indexOf(btn) == position:
+                        continue
+                    self.layout.removeWidget(btn)
+                self.layout.insertWidget(position, btn)
+        finally:
+            self.setUpdatesEnabled(True)
         self.updateGeometry()
 
+    @staticmethod
+    def get_tag_label(tag, count):
+        return f"#{tag} ({count})" if count > 0 else f"#{tag}"
+
     def create_tag_button(self, tag, count):
-        btn = QPushButton(f"#{tag} ({count})" if count > 0 else f"#{tag}")
-        color = self.get_tag_color(tag)
-
-        # Convert QColor to hex for stylesheet
-        color_hex = color.name()
-
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color_hex};
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 4px 12px;
-                font-size: 12px;
-                min-height: 25px;
-                text-align: left;
-            }}
-            QPushButton:hover {{
-                background-color: {self.adjust_brightness(color, 20).name()};
-            }}
-        """)
+        btn = QPushButton(self.get_tag_label(tag, count))
+        btn.setStyleSheet(self.get_tag_style(tag))
 
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        btn.setProperty("tagName", tag)
+        btn.clicked.connect(self._on_tag_button_clicked)
         return btn
 
+    def get_tag_style(self, tag):
+        """Stylesheet of the button of a tag, built once per tag"""
+        style = self._style_cache.get(tag)
+        if style is None:
+            color = self.get_tag_color(tag)
+            hover_color_hex = self._color_cache[tag][1]
+            style = _TAG_QSS_TPL % {"c": color.name(), "h": hover_color_hex}
+            self._style_cache[tag] = style
+        return style
+
     def get_tag_color(self, tag):
+        colors = self._color_cache.get(tag)
+        if colors is not None:
+            return colors[0]
+
         # Generate consistent color for tag
-        hash_object = hashlib.md5(tag.encode())
-        hash_hex = hash_object.hexdigest()
-        hue = int(hash_hex[:8], 16) % 360 / 360.0
-        saturation = 0.7 + (int(hash_hex[8:10], 16) % 30) / 100.0
-        value = 0.6 + (int(hash_hex[10:12], 16) % 40) / 100.0
+        tag_hash = zlib.crc32(tag.encode())
+        hue = tag_hash % 360 / 360.0
+        saturation = 0.7 + ((tag_hash >> 16) & 0xFF) % 30 / 100.0
+        value = 0.6 + ((tag_hash >> 24) & 0xFF) % 40 / 100.0
 
         rgb = colorsys.hsv_to_rgb(hue, saturation, value)
         r, g, b = [int(c * 255) for c in rgb]
-        return QColor(r, g, b)
+        color = QColor(r, g, b)
+        self._color_cache[tag] = (color, self.adjust_brightness(color, 20).name())
+        return color
 
     def adjust_brightness(self, color, delta):
         """Adjust the brightness of a QColor"""
@@ -110,6 +139,9 @@ class TagPanel(QWidget):
         adjusted = QColor.fromHsl(hsl.hue(), hsl.saturation(), lightness)
         return adjusted
 
+    def _on_tag_button_clicked(self):
+        self.on_tag_click(self.sender().property("tagName"))
+
     def on_tag_click(self, tag):
         if self.on_tag_click_callback:
             self.on_tag_click_callback(tag)
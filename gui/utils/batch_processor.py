@@ -0,0 +1,44 @@
+from PySide6.QtCore import QTimer
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BatchProcessor:
+    """
+    Collects callables and runs them together on the next event loop pass.
+
+    Work is grouped into levels which are drained in ascending order, so
+    mutations queued on a lower level are done before the layout work queued
+    on a higher one. A callable added to the same level several times before
+    the flush is run only once.
+    """
+
+    def __init__(self):
+        self._levels = {}
+        self._scheduled = False
+
+    def add(self, level, fn):
+        """
+        Queue a callable for the next flush.
+
+        Args:
+            level (int): Level to run the callable at, lower levels run first.
+            fn: Callable without arguments.
+        """
+        callbacks = self._levels.setdefault(level, [])
+        if fn not in callbacks:
+            callbacks.append(fn)
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self._flush)
+
+    def _flush(self):
+        self._scheduled = False
+        levels, self._levels = self._levels, {}
+        for level in sorted(levels):
+            for fn in levels[level]:
+                try:
+                    fn()
+                except Exception as e:
+                    logger.error(f"Error in batched call {fn}: {e}")
@@ -0,0 +1,25 @@
+from PySide6.QtGui import QFont
+
+# Bold fonts per point size, None for the default size
+_bold_fonts = {}
+
+
+def bold_font(point_size=None):
+    """
+    Bold font, created once per point size and shared by all widgets.
+
+    Args:
+        point_size (int, optional): Point size. If None, the default size of
+            QFont is kept.
+
+    Returns:
+        QFont: Shared bold font, not to be modified.
+    """
+    font = _bold_fonts.get(point_size)
+    if font is None:
+        font = QFont()
+        font.setBold(True)
+        if point_size is not None:
+            font.setPointSize(point_size)
+        _bold_fonts[point_size] = font
+    return font
@@ -7,6 +7,15 @@ class ToggleSwitch(QWidget):
     # Signal emitted when the toggle state changes
     stateChanged = Signal(bool)
 
+    # Default colors shared by all switches (can be overridden by stylesheet)
+    ON_COLOR = QColor(0, 150, 0)  # Green
+    OFF_COLOR = QColor(150, 150, 150)  # Gray
+    HANDLE_COLOR = QColor(255, 255, 255)  # White
+
+    # Track colors between off and on, per (off, on) color pair
+    TRACK_STEPS = 64
+    _track_luts = {}
+
     def __init__(self, default_state=False, parent=None):
         super().__init__(parent)
         self.setFixedSize(60, 30)  # Fixed size for the toggle
@@ -14,10 +23,10 @@ class ToggleSwitch(QWidget):
         self._opacity = 1.0 * default_state  # Opacity for animation
         self.setCursor(Qt.CursorShape.PointingHandCursor)  # Hand cursor on hover
 
-        # Default colors (can be overridden by stylesheet)
-        self._on_color = QColor(0, 150, 0)  # Green
-        self._off_color = QColor(150, 150, 150)  # Gray
-        self._handle_color = QColor(255, 255, 255)  # White
+        self._on_color = self.ON_COLOR
+        self._off_color = self.OFF_COLOR
+        self._handle_color = self.HANDLE_COLOR
+        self._update_track_lut()
 
         # Animation for smooth transition
         self._animation = QPropertyAnimation(self, b"opacity")
@@ -61,26 +70,13 @@ class ToggleSwitch(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Background track - interpolate between off and on colors
+        # Background track - look up the color between off and on colors
         if self._opacity <= 0:
             track_color = self._off_color
         elif self._opacity >= 1:
             track_color = self._on_color
         else:
-            # Interpolate colors based on animation progress
-            r = (
-                self._off_color.red()
-                + (self._on_color.red() - self._off_color.red()) * self._opacity
-            )
-            g = (
-                self._off_color.green()
-                + (self._on_color.green() - self._off_color.green()) * self._opacity
-            )
-            b = (
-                self._off_color.blue()
-                + (self._on_color.blue() - self._off_color.blue()) * self._opacity
-            )
-            track_color = QColor(int(r), int(g), int(b))
+            track_color = self._track_lut[int(self._opacity * self.TRACK_STEPS)]
 
         painter.setBrush(track_color)
         painter.setPen(Qt.PenStyle.NoPen)
@@ -99,6 +95,23 @@ class ToggleSwitch(QWidget):
         painter.setBrush(self._handle_color)  # Configurable handle color
         painter.drawEllipse(handle_x, handle_margin, handle_size, handle_size)
 
+    def _update_track_lut(self):
+        """Get the interpolated track colors for the current off/on colors"""
+        key = (self._off_color.rgba(), self._on_color.rgba())
+        lut = ToggleSwitch._track_luts.get(key)
+        if lut is None:
+            off, on = self._off_color, self._on_color
+            lut = [
+                QColor(
+                    int(off.red() + (on.red() - off.red()) * t),
+                    int(off.green() + (on.green() - off.green()) * t),
+                    int(off.blue() + (on.blue() - off.blue()) * t),
+                )
+                for t in (i / self.TRACK_STEPS for i in range(self.TRACK_STEPS + 1))
+            ]
+            ToggleSwitch._track_luts[key] = lut
+        self._track_lut = lut
+
     def setState(self, state):
         """Set toggle state without animation"""
         self._state = state
@@ -117,6 +130,7 @@ class ToggleSwitch(QWidget):
             self._on_color = QColor(color)
         else:
             self._on_color = color
+        self._update_track_lut()
         self.update()
 
     def setOffColor(self, color):
@@ -125,6 +139,7 @@ class ToggleSwitch(QWidget):
             self._off_color = QColor(color)
         else:
             self._off_color = color
+        self._update_track_lut()
         self.update()
 
     def setHandleColor(self, color):
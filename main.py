@@ -7,14 +7,10 @@ Entry point for the application
 import sys
 import logging
 import click
-from app import ClimptApp
 import signal
 
 logger = logging.getLogger(__name__)
 
-# Handle Ctrl+C gracefully
-signal.signal(signal.SIGINT, signal.SIG_DFL)
-
 
 @click.option("--verbose", "-v", count=True, help="Increase verbosity of logging")
 @click.option("--quiet", "-q", count=True, help="Decrease verbosity of logging")
@@ -30,6 +26,12 @@ def main(verbose, quiet):
         datefmt="%Y-%m-%d] [%H:%M:%S",
     )
 
+    # Handle Ctrl+C gracefully
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    # Imported here so that --help does not load Qt
+    from app import ClimptApp
+
     app = ClimptApp()
     exit_code = app.exec()
     logger.debug("Application exited with code %s", exit_code)
@@ -1,16 +1,120 @@
+import hashlib
 import json
 import os
 import logging
+import shutil
+import time
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, the standard library is used instead
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 PROMPTS_FILE = "prompts.json"
+_PROMPTS_DIR = os.path.dirname(PROMPTS_FILE) or "."
+_dir_ready = False
+
+# Fields every prompt must have
+_REQUIRED = frozenset(("id", "name", "content"))
+
+# Hash of the prompts file content as last read or written
+_last_hash = None
+# (size, mtime_ns) of the prompts file when it was last read or written
+_last_stat = None
+
+
+def _loads(raw):
+    """Parse JSON from UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _hash(payload):
+    """Short digest of a file content, to detect no-op saves"""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _dumps(data, pretty=False):
+    """Serialize data to compact, or indented if pretty, UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _file_stat():
+    """(size, mtime_ns) of the prompts file, or None if it is missing"""
+    try:
+        st = os.stat(PROMPTS_FILE)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _ensure_prompts_dir():
+    """Create the directory of the prompts file, once per run"""
+    global _dir_ready
+    if not _dir_ready:
+        os.makedirs(_PROMPTS_DIR, exist_ok=True)
+        _dir_ready = True
+
+
+def _write_atomic(payload):
+    """
+    Replace the prompts file with new content.
+
+    The content is written and flushed to a temporary file first, which then
+    replaces the prompts file, so an interrupted save never leaves a
+    truncated prompts file behind.
+    """
+    tmp_file = f"{PROMPTS_FILE}.tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, PROMPTS_FILE)
+
+
+def validate_prompt(prompt):
+    """
+    Check that a prompt has the fields the application relies on.
+
+    Args:
+        prompt: Prompt to check.
+
+    Returns:
+        bool: True if the prompt is a dictionary with an integer id, a string
+            name and content, and an optional list of string tags, False
+            otherwise.
+    """
+    if not isinstance(prompt, dict) or not _REQUIRED.issubset(prompt):
+        return False
+    tags = prompt.get("tags")
+    return (
+        isinstance(prompt["id"], int)
+        and not isinstance(prompt["id"], bool)
+        and isinstance(prompt["name"], str)
+        and isinstance(prompt["content"], str)
+        and (
+            tags is None
+            or (isinstance(tags, list) and all(isinstance(tag, str) for tag in tags))
+        )
+    )
 
 
 def load_prompts():
     """Load prompts from JSON file"""
+    global _last_hash, _last_stat
     try:
-        if not os.path.exists(PROMPTS_FILE):
+        try:
+            _last_stat = _file_stat()
+            raw = Path(PROMPTS_FILE).read_bytes()
+        except FileNotFoundError:
             # Create default data structure
             default_data = {
                 "prompts": [
@@ -23,83 +127,121 @@ def load_prompts():
                 ]
             }
             # Ensure directory exists
-            os.makedirs(
-                os.path.dirname(PROMPTS_FILE) if os.path.dirname(PROMPTS_FILE) else ".",
-                exist_ok=True,
-            )
-            with open(PROMPTS_FILE, "w", encoding="utf-8") as f:
-                json.dump(default_data, f, indent=2, ensure_ascii=False)
+            _ensure_prompts_dir()
+            payload = _dumps(default_data)
+            _write_atomic(payload)
+            _last_hash = _hash(payload)
+            _last_stat = _file_stat()
             return default_data["prompts"]
 
         # Load existing file
-        with open(PROMPTS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            prompts = data.get("prompts", [])
-            logger.info(f"Loaded {len(prompts)} prompts from {PROMPTS_FILE}")
-            return prompts
+        data = _loads(raw)
+        _last_hash = _hash(raw)
+        prompts = data.get("prompts", [])
+        valid_prompts = [prompt for prompt in prompts if validate_prompt(prompt)]
+        if len(valid_prompts) != len(prompts):
+            # Keep the skipped prompts recoverable before the next save, or
+            # keep them loaded if that fails so saving writes them back
+            if not backup_prompts(timestamped=True):
+                logger.error("Found invalid prompts in %s", PROMPTS_FILE)
+                return prompts
+            logger.error(
+                "Skipped %d invalid prompts in %s",
+                len(prompts) - len(valid_prompts),
+                PROMPTS_FILE,
+            )
+        logger.info("Loaded %d prompts from %s", len(valid_prompts), PROMPTS_FILE)
+        return valid_prompts
 
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in {PROMPTS_FILE}: {e}")
+        logger.error("Invalid JSON in %s: %s", PROMPTS_FILE, e)
         # Return empty list but don't overwrite the corrupted file
         return []
     except PermissionError as e:
-        logger.error(f"Permission denied accessing {PROMPTS_FILE}: {e}")
+        logger.error("Permission denied accessing %s: %s", PROMPTS_FILE, e)
         return []
     except Exception as e:
-        logger.error(f"Unexpected error loading prompts: {e}")
+        logger.error("Unexpected error loading prompts: %s", e)
         return []
 
 
-def save_prompts(prompts):
-    """Save prompts to JSON file"""
+def save_prompts(prompts, pretty=False):
+    """
+    Save prompts to JSON file.
+
+    Prompts are validated when they are loaded or edited, see
+    validate_prompt, so they are not checked again here.
+
+    Args:
+        prompts (list): Prompts to save.
+        pretty (bool): Indent the JSON, e.g. for a file meant to be read.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    global _last_hash, _last_stat
     try:
         # Ensure directory exists
-        os.makedirs(
-            os.path.dirname(PROMPTS_FILE) if os.path.dirname(PROMPTS_FILE) else ".",
-            exist_ok=True,
-        )
+        _ensure_prompts_dir()
 
         # Validate data structure
         if not isinstance(prompts, list):
             logger.error("Prompts must be a list")
             return False
 
-        # Validate each prompt
-        for i, prompt in enumerate(prompts):
-            if not isinstance(prompt, dict):
-                logger.error(f"Prompt {i} is not a dictionary")
-                return False
-            if "id" not in prompt or "name" not in prompt or "content" not in prompt:
-                logger.error(f"Prompt {i} missing required fields")
-                return False
-
-        # Save to file
-        with open(PROMPTS_FILE, "w", encoding="utf-8") as f:
-            json.dump({"prompts": prompts}, f, indent=2, ensure_ascii=False)
-        logger.info(f"Saved {len(prompts)} prompts to {PROMPTS_FILE}")
+        # Save to file, unless it still holds exactly this content, i.e. it
+        # was not changed or removed since it was last read or written
+        payload = _dumps({"prompts": prompts}, pretty)
+        payload_hash = _hash(payload)
+        if (
+            payload_hash == _last_hash
+            and _last_stat is not None
+            and _file_stat() == _last_stat
+        ):
+            logger.debug("Prompts unchanged, not rewriting %s", PROMPTS_FILE)
+            return True
+        _write_atomic(payload)
+        _last_hash = payload_hash
+        _last_stat = _file_stat()
+        logger.info("Saved %d prompts to %s", len(prompts), PROMPTS_FILE)
         return True
 
     except PermissionError as e:
-        logger.error(f"Permission denied writing to {PROMPTS_FILE}: {e}")
+        logger.error("Permission denied writing to %s: %s", PROMPTS_FILE, e)
         return False
     except Exception as e:
-        logger.error(f"Unexpected error saving prompts: {e}")
+        logger.error("Unexpected error saving prompts: %s", e)
         return False
 
 
-def backup_prompts():
-    """Create a backup of the prompts file"""
+def backup_prompts(timestamped=False):
+    """
+    Create a backup of the prompts file.
+
+    Args:
+        timestamped (bool): Name the backup after the current time, never
+            overwriting an earlier backup.
+
+    Returns:
+        bool: True if a backup was created, False otherwise.
+    """
     try:
         if os.path.exists(PROMPTS_FILE):
             backup_file = f"{PROMPTS_FILE}.backup"
-            import shutil
+            if timestamped:
+                stem = f"{PROMPTS_FILE}.{time.strftime('%Y%m%d-%H%M%S')}"
+                backup_file = f"{stem}.backup"
+                n = 1
+                while os.path.exists(backup_file):
+                    backup_file = f"{stem}-{n}.backup"
+                    n += 1
 
             shutil.copy2(PROMPTS_FILE, backup_file)
-            logger.info(f"Created backup of prompts file: {backup_file}")
+            logger.info("Created backup of prompts file: %s", backup_file)
             return True
         return False
     except Exception as e:
-        logger.error(f"Error creating backup: {e}")
+        logger.error("Error creating backup: %s", e)
         return False
 
 
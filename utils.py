@@ -3,9 +3,23 @@
 import pyperclip
 import logging
 import re
+import time
 
 logger = logging.getLogger(__name__)
 
+# Braces of multi-line QSS rules, as opposed to single-line {placeholders}
+_QSS_OPEN = re.compile("{([^}\n]*)\n")
+_QSS_CLOSE = re.compile("\n([^{\n]*)}")
+
+# Clipboard reads are slow on some platforms, reuse a read for a short time
+CLIPBOARD_CACHE_TTL = 0.05  # (seconds)
+_clipboard_cache = {"time": None, "content": ""}
+
+
+def _set_clipboard_cache(content):
+    _clipboard_cache["time"] = time.monotonic()
+    _clipboard_cache["content"] = content
+
 
 def insert_prompt(content):
     """
@@ -27,13 +41,14 @@ def insert_prompt(content):
             return False
 
         pyperclip.copy(content)
-        logger.debug(f"Successfully copied {len(content)} characters to clipboard")
+        _set_clipboard_cache(content)
+        logger.debug("Successfully copied %d characters to clipboard", len(content))
         return True
     except pyperclip.PyperclipException as e:
-        logger.error(f"Clipboard operation failed: {e}")
+        logger.error("Clipboard operation failed: %s", e)
         return False
     except Exception as e:
-        logger.error(f"Unexpected error copying to clipboard: {e}")
+        logger.error("Unexpected error copying to clipboard: %s", e)
         return False
 
 
@@ -41,17 +56,24 @@ def get_clipboard_content():
     """
     Get current clipboard content.
 
+    Content read less than CLIPBOARD_CACHE_TTL seconds ago is reused.
+
     Returns:
         str: Current clipboard content, or empty string if error.
     """
+    cached_at = _clipboard_cache["time"]
+    if cached_at is not None and time.monotonic() - cached_at < CLIPBOARD_CACHE_TTL:
+        return _clipboard_cache["content"]
     try:
         content = pyperclip.paste()
-        return content if isinstance(content, str) else ""
+        content = content if isinstance(content, str) else ""
+        _set_clipboard_cache(content)
+        return content
     except pyperclip.PyperclipException as e:
-        logger.error(f"Failed to read clipboard: {e}")
+        logger.error("Failed to read clipboard: %s", e)
         return ""
     except Exception as e:
-        logger.error(f"Unexpected error reading clipboard: {e}")
+        logger.error("Unexpected error reading clipboard: %s", e)
         return ""
 
 
@@ -64,13 +86,14 @@ def clear_clipboard():
     """
     try:
         pyperclip.copy("")
+        _set_clipboard_cache("")
         logger.debug("Clipboard cleared")
         return True
     except pyperclip.PyperclipException as e:
-        logger.error(f"Failed to clear clipboard: {e}")
+        logger.error("Failed to clear clipboard: %s", e)
         return False
     except Exception as e:
-        logger.error(f"Unexpected error clearing clipboard: {e}")
+        logger.error("Unexpected error clearing clipboard: %s", e)
         return False
 
 
@@ -85,7 +108,7 @@ def is_clipboard_empty():
         content = get_clipboard_content()
         return not content or not content.strip()
     except Exception as e:
-        logger.error(f"Error checking clipboard status: {e}")
+        logger.error("Error checking clipboard status: %s", e)
         return True
 
 
@@ -114,6 +137,6 @@ def truncate_text(text, max_length=100, suffix="..."):
 
 
 def correct_qss(qss):
-    qss = re.sub("{([^}\n]*)\n", r"{{\1\n", qss)
-    qss = re.sub("\n([^{\n]*)}", r"\n\1}}", qss)
+    qss = _QSS_OPEN.sub(r"{{\1\n", qss)
+    qss = _QSS_CLOSE.sub(r"\n\1}}", qss)
     return qss